@@ -7,6 +7,10 @@ import sqlite3
 from pathlib import Path
 import hashlib
 
+import pydeck as pdk
+
+from guest_map import read_zip_centroids, aggregate_guests_by_zip
+
 from supabase import create_client, Client
 import re
 
@@ -304,6 +308,61 @@ def delete_guest_entry(guest_id):
         st.error(f"Error deleting entry: {str(e)}")
         return False
 
+@st.cache_data
+def load_zip_centroids():
+    """Load the bundled ZIP code centroid table"""
+    return read_zip_centroids()
+
+def show_guest_map(df):
+    """Display a map of where guests are coming from"""
+    st.subheader("🗺️ Guest Map")
+    
+    zip_counts, unlocated, international = aggregate_guests_by_zip(df, load_zip_centroids())
+    
+    if zip_counts.empty:
+        st.info("No guest ZIP codes could be placed on the map.")
+        return
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        view = st.radio("Group guests by", ["ZIP Code", "Area"], horizontal=True)
+    with col2:
+        hex_km = st.slider("Area size (km)", 10, 200, 50, disabled=view != "Area")
+    
+    if view == "ZIP Code":
+        layer = pdk.Layer(
+            "ScatterplotLayer",
+            data=zip_counts,
+            get_position=['lon', 'lat'],
+            get_radius="radius",
+            radius_min_pixels=3,
+            get_fill_color=[255, 107, 157, 180],
+            pickable=True,
+        )
+        tooltip = {"text": "ZIP {zip_code}: {guests} guest(s)"}
+    else:
+        layer = pdk.Layer(
+            "HexagonLayer",
+            data=zip_counts,
+            get_position=['lon', 'lat'],
+            radius=hex_km * 1000,
+            get_color_weight="guests",
+            color_aggregation="SUM",
+            pickable=True,
+        )
+        tooltip = {"text": "{colorValue} guest(s) in this area"}
+    
+    st.pydeck_chart(pdk.Deck(
+        layers=[layer],
+        initial_view_state=pdk.ViewState(latitude=39.8, longitude=-98.6, zoom=3),
+        tooltip=tooltip,
+    ))
+    
+    if unlocated:
+        st.caption(f"{unlocated} guest(s) not shown: ZIP code not found in the bundled ZIP table.")
+    if international:
+        st.caption(f"{international} guest(s) outside the USA not shown.")
+
 # Main app
 def main():
     # Header
@@ -494,6 +553,8 @@ def show_responses():
         
         # Display filtered results
         if not filtered_df.empty:
+            show_guest_map(filtered_df)
+            
             st.subheader("Guest Entries")
             
             # Display each entry with delete option
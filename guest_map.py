@@ -0,0 +1,50 @@
+# Guest map helpers: offline ZIP code geocoding and aggregation
+
+from pathlib import Path
+
+import pandas as pd
+
+
+# Bundled ZIP centroid table (zip_code, lat, lon) used for offline geocoding
+ZIP_CENTROIDS_PATH = Path(__file__).parent / "data" / "zip_centroids.csv.gz"
+
+# 5-digit ZIP with an optional ZIP+4 suffix, or a 3-4 digit ZIP that lost its leading zeros
+ZIP_PATTERN = r'^(\d{5}(?=[-\s]?\d{4}$)|\d{3,5}$)'
+
+
+def read_zip_centroids(path=ZIP_CENTROIDS_PATH):
+    """Read a ZIP code centroid table indexed by 5-digit ZIP code"""
+    centroids = pd.read_csv(
+        path,
+        dtype={'zip_code': str, 'lat': 'float32', 'lon': 'float32'}
+    )
+    return centroids.set_index('zip_code')
+
+def normalize_zip_codes(zip_codes):
+    """Normalize ZIP codes to 5 digits; anything that isn't a US ZIP becomes NaN"""
+    return (
+        zip_codes.astype(str).str.strip()
+        .str.extract(ZIP_PATTERN, expand=False)
+        .str.zfill(5)
+    )
+
+def aggregate_guests_by_zip(df, centroids):
+    """Count guests per ZIP code and attach each ZIP's centroid coordinates
+
+    Returns (zip_counts, unlocated, international): guests per located ZIP,
+    the number of US guests whose ZIP wasn't found, and the number of non-US guests.
+    """
+    # The centroid table is US-only; a missing country means the 'USA' default
+    is_us = df['country'].fillna('USA').eq('USA')
+    zips = normalize_zip_codes(df.loc[is_us, 'zip_code'])
+
+    # Aggregate first so the join only touches one row per distinct ZIP
+    counts = zips.value_counts().rename('guests')
+    counts.index.name = 'zip_code'
+    located = counts.to_frame().join(centroids, how='inner')
+    # Marker radius in meters, computed here since deck.gl accessors can't call functions
+    located['radius'] = located['guests'] ** 0.5 * 3000
+
+    international = int((~is_us).sum())
+    unlocated = int(is_us.sum()) - int(located['guests'].sum())
+    return located.reset_index(), unlocated, international
@@ -0,0 +1,67 @@
+import pandas as pd
+
+from guest_map import aggregate_guests_by_zip, normalize_zip_codes, read_zip_centroids
+
+
+CENTROIDS = pd.DataFrame(
+    {
+        'zip_code': ['02134', '08001', '10001', '10115', '94105'],
+        'lat': [42.35, 39.69, 40.75, 40.80, 37.79],
+        'lon': [-71.13, -75.36, -74.00, -73.95, -122.39],
+    }
+).set_index('zip_code')
+
+
+def guests(rows):
+    return pd.DataFrame(rows, columns=['zip_code', 'country'])
+
+
+def test_normalize_zip_plus_four():
+    zips = pd.Series(['10001-1234', '100011234', '10001 1234'])
+    assert normalize_zip_codes(zips).tolist() == ['10001'] * 3
+
+
+def test_normalize_restores_leading_zeros():
+    zips = pd.Series(['2134', ' 02134 ', '8001'])
+    assert normalize_zip_codes(zips).tolist() == ['02134', '02134', '08001']
+
+
+def test_normalize_rejects_malformed():
+    zips = pd.Series(['123456', '1234567', '12345678', '12', 'H0H 0H0', '', None])
+    assert normalize_zip_codes(zips).isna().all()
+
+
+def test_aggregate_counts_per_zip():
+    df = guests([('02134', 'USA'), ('2134', 'USA'), ('10001-1234', None), ('94105', 'USA')])
+    zip_counts, unlocated, international = aggregate_guests_by_zip(df, CENTROIDS)
+
+    counts = dict(zip(zip_counts['zip_code'], zip_counts['guests']))
+    assert counts == {'02134': 2, '10001': 1, '94105': 1}
+    assert unlocated == 0
+    assert international == 0
+
+
+def test_aggregate_skips_foreign_postal_codes():
+    # Berlin 10115 and Zurich 8001 are also valid US ZIPs in the table
+    df = guests([('10115', 'Other'), ('8001', 'Other'), ('H0H 0H0', 'Canada'), ('94105', 'USA')])
+    zip_counts, unlocated, international = aggregate_guests_by_zip(df, CENTROIDS)
+
+    assert zip_counts['zip_code'].tolist() == ['94105']
+    assert unlocated == 0
+    assert international == 3
+
+
+def test_aggregate_counts_unlocated_us_guests():
+    df = guests([('123456', 'USA'), ('99999', 'USA'), ('', None), ('02134', 'USA')])
+    zip_counts, unlocated, international = aggregate_guests_by_zip(df, CENTROIDS)
+
+    assert zip_counts['guests'].sum() == 1
+    assert unlocated == 3
+    assert international == 0
+
+
+def test_bundled_centroid_table():
+    centroids = read_zip_centroids()
+    assert {'lat', 'lon'} <= set(centroids.columns)
+    assert centroids.index.str.fullmatch(r'\d{5}').all()
+    assert '02134' in centroids.index